@@ -1,9 +1,9 @@
 import json
 import re
-from typing import Any, Callable, Mapping, NamedTuple, TextIO
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Mapping, TextIO
 
 import github_action_utils as gha_utils  # type: ignore
-import yaml
 
 # Changelog Types
 PULL_REQUEST: str = "pull_request"
@@ -16,8 +16,70 @@ RESTRUCTUREDTEXT_FILE: str = "rst"
 
 UserConfigType = dict[str, str | bool | list[dict[str, str | list[str]]] | None]
 
+# Default regular expressions, compiled once at import
+_DEFAULT_TITLE_RE: re.Pattern[str] = re.compile(r"^(?i:release)")
+# The regular expression used to extract semantic versioning is a
+# slightly less restrictive modification of
+# the following regular expression
+# https://semver.org/#is-there-a-suggested-regular-expression-regex-to-check-a-semver-string
+_DEFAULT_VERSION_RE: re.Pattern[str] = re.compile(
+    r"v?(0|[1-9]\d*)\.(0|[1-9]\d*)\.?(0|[1-9]\d*)?(?:-(("
+    r"?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|["
+    r"1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(["
+    r"0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
+)
 
-class ActionEnvironment(NamedTuple):
+# Compiled patterns by regular expression, so that a user provided
+# regular expression is compiled once when it is validated and reused
+_compiled_patterns: dict[str, re.Pattern[str]] = {
+    pattern.pattern: pattern for pattern in (_DEFAULT_TITLE_RE, _DEFAULT_VERSION_RE)
+}
+
+
+def _compile_pattern(regex: str) -> re.Pattern[str]:
+    """Compile a regular expression or return the already compiled pattern"""
+    pattern = _compiled_patterns.get(regex)
+
+    if pattern is None:
+        pattern = _compiled_patterns[regex] = re.compile(regex)
+
+    return pattern
+
+
+def _bool_cleaner(option: str) -> Callable[[Any], bool | None]:
+    """Create a cleaner for a boolean configuration option"""
+
+    def clean(value: Any) -> bool | None:
+        # `True` and `False` are also `int` instances equal to `1` and `0`
+        if not isinstance(value, int) or value not in (0, 1):
+            gha_utils.warning(
+                f"`{option}` was not provided or not valid, "
+                "falling back to default value."
+            )
+            return None
+        return bool(value)
+
+    clean.__doc__ = f"clean {option} configuration option"
+    return clean
+
+
+def _str_cleaner(
+    option: str, message: str, level: str = "warning"
+) -> Callable[[Any], str | None]:
+    """Create a cleaner for a string configuration option"""
+
+    def clean(value: Any) -> str | None:
+        if not value or not isinstance(value, str):
+            getattr(gha_utils, level)(message)
+            return None
+        return value
+
+    clean.__doc__ = f"clean {option} configuration option"
+    return clean
+
+
+@dataclass(frozen=True, slots=True)
+class ActionEnvironment:
     event_path: str
     repository: str
     pull_request_branch: str
@@ -39,26 +101,18 @@ class ActionEnvironment(NamedTuple):
         )
 
 
-class Configuration(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class Configuration:
     """Configuration class for Changelog CI"""
 
     header_prefix: str = "Version:"
     commit_changelog: bool = True
     comment_changelog: bool = False
-    pull_request_title_regex: str = r"^(?i:release)"
-    # The regular expression used to extract semantic versioning is a
-    # slightly less restrictive modification of
-    # the following regular expression
-    # https://semver.org/#is-there-a-suggested-regular-expression-regex-to-check-a-semver-string
-    version_regex: str = (
-        r"v?(0|[1-9]\d*)\.(0|[1-9]\d*)\.?(0|[1-9]\d*)?(?:-(("
-        r"?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|["
-        r"1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(["
-        r"0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
-    )
+    pull_request_title_regex: str = _DEFAULT_TITLE_RE.pattern
+    version_regex: str = _DEFAULT_VERSION_RE.pattern
     changelog_type: str = PULL_REQUEST
-    group_config: list[dict[str, str | list[str]]] = []
-    exclude_labels: list[str] = []
+    group_config: tuple[dict[str, str | list[str]], ...] = ()
+    exclude_labels: tuple[str, ...] = ()
     include_unlabeled_changes: bool = True
     unlabeled_group_title: str = "Other Changes"
     changelog_filename: str = f"CHANGELOG.{MARKDOWN_FILE}"
@@ -68,12 +122,44 @@ class Configuration(NamedTuple):
     release_version: str | None = None
     github_token: str | None = None
 
+    _changelog_file_type: str = field(init=False, repr=False, compare=False)
+    _pull_request_title_pattern: re.Pattern[str] = field(
+        init=False, repr=False, compare=False
+    )
+    _version_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The configuration is immutable, so the file type
+        # and the compiled patterns only need to be determined once
+        if self.changelog_filename.endswith(".rst"):
+            changelog_file_type = RESTRUCTUREDTEXT_FILE
+        else:
+            changelog_file_type = MARKDOWN_FILE
+
+        object.__setattr__(self, "_changelog_file_type", changelog_file_type)
+        object.__setattr__(
+            self,
+            "_pull_request_title_pattern",
+            _compile_pattern(self.pull_request_title_regex),
+        )
+        object.__setattr__(
+            self, "_version_pattern", _compile_pattern(self.version_regex)
+        )
+
     @property
     def changelog_file_type(self) -> str:
         """changelog_file_type option"""
-        if self.changelog_filename.endswith(".rst"):
-            return RESTRUCTUREDTEXT_FILE
-        return MARKDOWN_FILE
+        return self._changelog_file_type
+
+    @property
+    def pull_request_title_pattern(self) -> re.Pattern[str]:
+        """Compiled pull_request_title_regex option"""
+        return self._pull_request_title_pattern
+
+    @property
+    def version_pattern(self) -> re.Pattern[str]:
+        """Compiled version_regex option"""
+        return self._version_pattern
 
     @property
     def git_commit_author(self) -> str:
@@ -95,12 +181,18 @@ class Configuration(NamedTuple):
         Read user provided configuration file and input and
         return user configuration
         """
+        # inputs that were not provided are left out,
+        # so that they fall back to the default values without being cleaned
         user_config: UserConfigType = {
-            "changelog_filename": env.get("INPUT_CHANGELOG_FILENAME"),
-            "git_committer_username": env.get("INPUT_COMMITTER_USERNAME"),
-            "git_committer_email": env.get("INPUT_COMMITTER_EMAIL"),
-            "release_version": env.get("INPUT_RELEASE_VERSION"),
-            "github_token": env.get("INPUT_GITHUB_TOKEN"),
+            key: value
+            for key, value in (
+                ("changelog_filename", env.get("INPUT_CHANGELOG_FILENAME")),
+                ("git_committer_username", env.get("INPUT_COMMITTER_USERNAME")),
+                ("git_committer_email", env.get("INPUT_COMMITTER_EMAIL")),
+                ("release_version", env.get("INPUT_RELEASE_VERSION")),
+                ("github_token", env.get("INPUT_GITHUB_TOKEN")),
+            )
+            if value is not None
         }
         config_file_path = env.get("INPUT_CONFIG_FILE")
 
@@ -128,6 +220,9 @@ class Configuration(NamedTuple):
             # parse config files with the extension .yml and .yaml
             # using YAML syntax
             if config_file_path.endswith("yml") or config_file_path.endswith("yaml"):
+                # only import yaml when a YAML configuration file is used
+                import yaml
+
                 loader = yaml.safe_load
             # parse config files with the extension .json
             # using JSON syntax
@@ -158,47 +253,29 @@ class Configuration(NamedTuple):
         cleaned_user_config: dict[str, Any] = {}
 
         for key, value in user_config.items():
-            if key in cls._fields:
-                cleand_value = getattr(cls, f"clean_{key.lower()}", lambda x: None)(
-                    value
-                )
-                if cleand_value is not None:
-                    cleaned_user_config[key] = cleand_value
+            cleaner = CONFIGURATION_CLEANERS.get(key)
+
+            if cleaner is None:
+                continue
+
+            cleand_value = cleaner(value)
+
+            if cleand_value is not None:
+                cleaned_user_config[key] = cleand_value
 
         return cleaned_user_config
 
-    @classmethod
-    def clean_header_prefix(cls, value: Any) -> str | None:
-        """clean header_prefix configuration option"""
-        if not value or not isinstance(value, str):
-            gha_utils.warning(
-                "`header_prefix` was not provided or not valid, "
-                "falling back to default value."
-            )
-            return None
-        return value
+    clean_header_prefix = staticmethod(
+        _str_cleaner(
+            "header_prefix",
+            "`header_prefix` was not provided or not valid, "
+            "falling back to default value.",
+        )
+    )
 
-    @classmethod
-    def clean_commit_changelog(cls, value: Any) -> bool | None:
-        """clean commit_changelog configuration option"""
-        if value not in [0, 1, False, True]:
-            gha_utils.warning(
-                "`commit_changelog` was not provided or not valid, "
-                "falling back to default value."
-            )
-            return None
-        return bool(value)
+    clean_commit_changelog = staticmethod(_bool_cleaner("commit_changelog"))
 
-    @classmethod
-    def clean_comment_changelog(cls, value: Any) -> bool | None:
-        """clean comment_changelog configuration option"""
-        if value not in [0, 1, False, True]:
-            gha_utils.warning(
-                "`comment_changelog` was not provided or not valid, "
-                "falling back to default value."
-            )
-            return None
-        return bool(value)
+    clean_comment_changelog = staticmethod(_bool_cleaner("comment_changelog"))
 
     @classmethod
     def clean_pull_request_title_regex(cls, value: str) -> str | None:
@@ -211,8 +288,9 @@ class Configuration(NamedTuple):
             return None
 
         try:
-            # This will raise an error if the provided regex is not valid
-            re.compile(value)
+            # This will raise an error if the provided regex is not valid,
+            # the compiled pattern is reused by the configuration
+            _compile_pattern(value)
             return value
         except Exception:
             gha_utils.error(
@@ -231,8 +309,9 @@ class Configuration(NamedTuple):
             return None
 
         try:
-            # This will raise an error if the provided regex is not valid
-            re.compile(value)
+            # This will raise an error if the provided regex is not valid,
+            # the compiled pattern is reused by the configuration
+            _compile_pattern(value)
             return value
         except Exception:
             gha_utils.warning(
@@ -254,28 +333,17 @@ class Configuration(NamedTuple):
             return None
         return value
 
-    @classmethod
-    def clean_include_unlabeled_changes(cls, value: Any) -> bool | None:
-        """clean include_unlabeled_changes configuration option"""
-        if value not in [0, 1, False, True]:
-            gha_utils.warning(
-                "`include_unlabeled_changes` was not provided or not valid, "
-                "falling back to default value."
-            )
-            return None
-
-        return bool(value)
+    clean_include_unlabeled_changes = staticmethod(
+        _bool_cleaner("include_unlabeled_changes")
+    )
 
-    @classmethod
-    def clean_unlabeled_group_title(cls, value: Any) -> str | None:
-        """clean unlabeled_group_title configuration option"""
-        if not value or not isinstance(value, str):
-            gha_utils.warning(
-                "`unlabeled_group_title` was not provided or not valid, "
-                "falling back to default value."
-            )
-            return None
-        return value
+    clean_unlabeled_group_title = staticmethod(
+        _str_cleaner(
+            "unlabeled_group_title",
+            "`unlabeled_group_title` was not provided or not valid, "
+            "falling back to default value.",
+        )
+    )
 
     @classmethod
     def clean_changelog_filename(cls, value: Any) -> str | None:
@@ -295,59 +363,48 @@ class Configuration(NamedTuple):
             )
             return None
 
-    @classmethod
-    def clean_git_committer_username(cls, value: Any) -> str | None:
-        """clean git_committer_username item configuration option"""
-        if value and isinstance(value, str):
-            return value
-        else:
-            gha_utils.warning(
-                "`git_committer_username` was not provided, "
-                "Falling back to default value."
-            )
-            return None
+    clean_git_committer_username = staticmethod(
+        _str_cleaner(
+            "git_committer_username",
+            "`git_committer_username` was not provided, "
+            "Falling back to default value.",
+        )
+    )
 
-    @classmethod
-    def clean_git_committer_email(cls, value: Any) -> str | None:
-        """clean git_committer_email item configuration option"""
-        if value and isinstance(value, str):
-            return value
-        else:
-            gha_utils.warning(
-                "`git_committer_email` was not provided, "
-                "Falling back to default value."
-            )
-            return None
+    clean_git_committer_email = staticmethod(
+        _str_cleaner(
+            "git_committer_email",
+            "`git_committer_email` was not provided, Falling back to default value.",
+        )
+    )
 
-    @classmethod
-    def clean_release_version(cls, value: Any) -> str | None:
-        """clean release_version item configuration option"""
-        if value and isinstance(value, str):
-            return value
-        else:
-            gha_utils.notice("`release_version` was not provided as an input.")
-            return None
+    clean_release_version = staticmethod(
+        _str_cleaner(
+            "release_version",
+            "`release_version` was not provided as an input.",
+            "notice",
+        )
+    )
 
-    @classmethod
-    def clean_github_token(cls, value: Any) -> str | None:
-        """clean release_version item configuration option"""
-        if value and isinstance(value, str):
-            return value
-        else:
-            gha_utils.notice("`github_token` was not provided as an input.")
-            return None
+    clean_github_token = staticmethod(
+        _str_cleaner(
+            "github_token",
+            "`github_token` was not provided as an input.",
+            "notice",
+        )
+    )
 
     @classmethod
-    def clean_exclude_labels(cls, value: Any) -> list[str] | None:
+    def clean_exclude_labels(cls, value: Any) -> tuple[str, ...] | None:
         """clean exclude_labels item configuration option"""
         if value and isinstance(value, list):
-            return value
+            return tuple(value)
         else:
             gha_utils.notice("`exclude_labels` was not provided as an input.")
-            return []
+            return ()
 
     @classmethod
-    def clean_group_config(cls, value: Any) -> list[dict[str, Any]] | None:
+    def clean_group_config(cls, value: Any) -> tuple[dict[str, Any], ...] | None:
         """clean group_config configuration option"""
         group_config = []
 
@@ -364,7 +421,7 @@ class Configuration(NamedTuple):
             if cleaned_group_config_item:
                 group_config.append(cleaned_group_config_item)
 
-        return group_config
+        return tuple(group_config)
 
     @classmethod
     def _clean_group_config_item(
@@ -402,3 +459,12 @@ class Configuration(NamedTuple):
             return None
 
         return value
+
+
+# Map each configuration option to its cleaner,
+# built once so that cleaning does not need to look them up by name
+CONFIGURATION_CLEANERS: dict[str, Callable[[Any], Any]] = {
+    option.name: getattr(Configuration, f"clean_{option.name}")
+    for option in fields(Configuration)
+    if hasattr(Configuration, f"clean_{option.name}")
+}
@@ -1,6 +1,8 @@
 import abc
 import os
-import re
+import shutil
+import stat
+import tempfile
 import time
 from typing import Any
 
@@ -29,6 +31,9 @@ from .run_git import (
 )
 from .utils import display_whats_new, get_request_headers
 
+# Size of the chunks used to copy the existing changelog data
+CHANGELOG_COPY_CHUNK_SIZE: int = 1024 * 1024
+
 
 class ChangelogCIBase(abc.ABC):
     """Base Class for Changelog CI"""
@@ -45,21 +50,6 @@ class ChangelogCIBase(abc.ABC):
             config, action_env, self.release_version
         )
 
-    @property
-    def _open_file_mode(self) -> str:
-        """Gets the mode that the changelog file should be opened in"""
-        if os.path.exists(self.config.changelog_filename):
-            # if the changelog file exists
-            # opens it in read-write mode
-            file_mode = "r+"
-        else:
-            # if the changelog file does not exist
-            # opens it in read-write mode
-            # but creates the file first also
-            file_mode = "w+"
-
-        return file_mode
-
     @property
     def _comment_issue_number(self) -> Any:
         """Issue number to comment on"""
@@ -90,17 +80,65 @@ class ChangelogCIBase(abc.ABC):
 
     def _update_changelog_file(self, string_data: str) -> None:
         """Write changelog to the changelog file"""
-        with open(self.config.changelog_filename, self._open_file_mode) as f:
-            # read the existing data and store it in a variable
-            body = f.read()
-            # write at the top of the file
-            f.seek(0, 0)
-            f.write(string_data)
-
-            if body:
-                # re-write the existing data
-                f.write("\n\n")
-                f.write(body)
+        # resolve symlinks so that the file the changelog
+        # points to is updated instead of the link being replaced
+        changelog_filename = os.path.realpath(self.config.changelog_filename)
+        # encode the changelog once and copy the existing data as bytes,
+        # so that the existing data does not need to be decoded
+        changelog_data = string_data.encode("utf-8")
+
+        try:
+            changelog_file = open(changelog_filename, "rb")
+        except FileNotFoundError:
+            # if the changelog file does not exist
+            # there is no existing data to preserve
+            with open(changelog_filename, "wb") as f:
+                f.write(changelog_data)
+            return
+
+        with changelog_file:
+            # write the new changelog and the existing data to a temporary file
+            # in the same directory and then replace the changelog file with it,
+            # so that a failed write never leaves a partially written changelog
+            temp_file = tempfile.NamedTemporaryFile(
+                mode="wb",
+                dir=os.path.dirname(changelog_filename),
+                delete=False,
+            )
+
+            try:
+                with temp_file:
+                    # write at the top of the file
+                    temp_file.write(changelog_data)
+                    # copy the existing data in chunks instead of reading it at once
+                    body = changelog_file.read(CHANGELOG_COPY_CHUNK_SIZE)
+
+                    if body:
+                        # re-write the existing data
+                        temp_file.write(b"\n\n")
+                        temp_file.write(body)
+                        shutil.copyfileobj(
+                            changelog_file, temp_file, CHANGELOG_COPY_CHUNK_SIZE
+                        )
+
+                    # make sure the data is on disk before it replaces the changelog
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+
+                # keep the permissions and the owner of the existing changelog file
+                file_stat = os.fstat(changelog_file.fileno())
+                os.chmod(temp_file.name, stat.S_IMODE(file_stat.st_mode))
+
+                try:
+                    os.chown(temp_file.name, file_stat.st_uid, file_stat.st_gid)
+                except PermissionError:
+                    # only root can give the file to another user
+                    pass
+
+                os.replace(temp_file.name, changelog_filename)
+            except BaseException:
+                os.remove(temp_file.name)
+                raise
 
     def _commit_changelog(self, commit_branch_name: str) -> None:
         """Commit Changelog"""
@@ -235,8 +273,7 @@ class ChangelogCIPullRequestEvent(ChangelogCIBase):
     def _get_release_version(self) -> str:
         """Get release version number from the pull request title or user Input"""
         pull_request_title = self.event_payload["pull_request"]["title"]
-        pattern = re.compile(self.config.version_regex)
-        match = pattern.search(pull_request_title)
+        match = self.config.version_pattern.search(pull_request_title)
 
         if match:
             return match.group()
@@ -266,8 +303,7 @@ class ChangelogCIPullRequestEvent(ChangelogCIBase):
     def _check_pull_request_title(self) -> None:
         """Check if changelog should be generated for this pull request"""
         pull_request_title = self.event_payload["pull_request"]["title"]
-        pattern = re.compile(self.config.pull_request_title_regex)
-        match = pattern.search(pull_request_title)
+        match = self.config.pull_request_title_pattern.search(pull_request_title)
 
         if not match and not self.config.release_version:
             # if pull request regex doesn't match then exit
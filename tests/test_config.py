@@ -1,3 +1,4 @@
+import re
 import unittest
 from unittest import mock
 
@@ -40,7 +41,7 @@ class TestConfiguration(unittest.TestCase):
                 r"0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
             ),
         )
-        self.assertEqual(config.group_config, [])
+        self.assertEqual(config.group_config, ())
         self.assertTrue(config.include_unlabeled_changes)
         self.assertEqual(config.unlabeled_group_title, "Other Changes")
         self.assertEqual(config.changelog_filename, f"CHANGELOG.{MARKDOWN_FILE}")
@@ -97,7 +98,7 @@ class TestConfiguration(unittest.TestCase):
                 "1,2})\\s\\(\\d{1,2}-\\d{1,2}-\\d{4}\\)"
             ),
         )
-        self.assertEqual(config.group_config, group_config)
+        self.assertEqual(config.group_config, tuple(group_config))
         self.assertFalse(config.include_unlabeled_changes)
         self.assertEqual(config.unlabeled_group_title, "Unlabeled Changes")
         self.assertEqual(config.changelog_filename, "MY_CHANGELOG.rst")
@@ -153,7 +154,7 @@ class TestConfiguration(unittest.TestCase):
                 r"0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?"
             ),
         )
-        self.assertEqual(config.group_config, [])
+        self.assertEqual(config.group_config, ())
         self.assertTrue(config.include_unlabeled_changes)
         self.assertEqual(config.unlabeled_group_title, "Other Changes")
         self.assertEqual(config.changelog_filename, f"CHANGELOG.{MARKDOWN_FILE}")
@@ -186,6 +187,27 @@ class TestConfiguration(unittest.TestCase):
         config = Configuration.create(default_env_dict)
         self.assertEqual(config.changelog_file_type, MARKDOWN_FILE)
 
+    def test_compiled_patterns(self, gha_utils):
+        config = Configuration.create({})
+        self.assertTrue(config.pull_request_title_pattern.search("Release v1.0.0"))
+        self.assertEqual(
+            config.version_pattern.search("Release v1.0.0").group(), "v1.0.0"
+        )
+        self.assertEqual(config.version_pattern.pattern, config.version_regex)
+        self.assertIs(config.version_pattern, Configuration().version_pattern)
+
+    @mock.patch(
+        "scripts.config.Configuration.get_config_file_data",
+    )
+    def test_user_pattern_is_compiled_once(self, get_config_file_data, gha_utils):
+        get_config_file_data.return_value = {"version_regex": r"version-(\d+)"}
+
+        with mock.patch("scripts.config.re.compile", wraps=re.compile) as compile:
+            config = Configuration.create(default_env_dict)
+
+        compile.assert_called_once_with(r"version-(\d+)")
+        self.assertEqual(config.version_pattern.pattern, r"version-(\d+)")
+
     def test_git_commit_author(self, gha_utils):
         env_dict = {
             "INPUT_COMMITTER_USERNAME": "changelog-ci",
@@ -206,6 +228,15 @@ class TestConfiguration(unittest.TestCase):
             },
         )
 
+    def test_get_user_config_without_inputs(self, gha_utils):
+        self.assertEqual(Configuration.get_user_config({}), {})
+        self.assertEqual(
+            Configuration.get_user_config(
+                {"INPUT_RELEASE_VERSION": "1.0.0", "INPUT_GITHUB_TOKEN": None}
+            ),
+            {"release_version": "1.0.0"},
+        )
+
     @mock.patch(
         "scripts.config.Configuration.get_config_file_data",
     )
@@ -303,6 +334,15 @@ class TestConfiguration(unittest.TestCase):
         self.assertIsNone(Configuration.clean_release_version(1.1))
         self.assertIsNone(Configuration.clean_release_version(True))
 
+    def test_clean_github_token(self, gha_utils):
+        self.assertEqual(Configuration.clean_github_token("12345"), "12345")
+
+        self.assertIsNone(Configuration.clean_github_token(""))
+        gha_utils.notice.assert_called_once_with(
+            "`github_token` was not provided as an input."
+        )
+        gha_utils.warning.assert_not_called()
+
     def test_clean_group_config(self, gha_utils):
         group_config = [
             {"title": "Bug Fixes", "labels": ["bug", "bugfix"]},
@@ -311,7 +351,9 @@ class TestConfiguration(unittest.TestCase):
                 "labels": ["docs", "documentation", "doc"],
             },
         ]
-        self.assertEqual(Configuration.clean_group_config(group_config), group_config)
+        self.assertEqual(
+            Configuration.clean_group_config(group_config), tuple(group_config)
+        )
 
         self.assertIsNone(Configuration.clean_group_config("test"))
         self.assertIsNone(Configuration.clean_group_config([]))
@@ -332,8 +374,8 @@ class TestConfiguration(unittest.TestCase):
         exclude_labels = ["skip-changelog", "dependabot"]
 
         self.assertEqual(
-            Configuration.clean_exclude_labels(exclude_labels), exclude_labels
+            Configuration.clean_exclude_labels(exclude_labels), tuple(exclude_labels)
         )
 
-        self.assertEqual(Configuration.clean_exclude_labels("test"), [])
-        self.assertEqual(Configuration.clean_exclude_labels({"title": "test"}), [])
+        self.assertEqual(Configuration.clean_exclude_labels("test"), ())
+        self.assertEqual(Configuration.clean_exclude_labels({"title": "test"}), ())
@@ -0,0 +1,96 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from scripts.config import Configuration
+from scripts.main import ChangelogCIBase
+
+
+class TestUpdateChangelogFile(unittest.TestCase):
+    """Test ChangelogCIBase._update_changelog_file"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = temp_dir.name
+        self.changelog_filename = os.path.join(self.directory, "CHANGELOG.md")
+
+    def update_changelog_file(self, string_data):
+        ci = mock.Mock(config=Configuration(changelog_filename=self.changelog_filename))
+        ChangelogCIBase._update_changelog_file(ci, string_data)
+
+    def write_changelog_file(self, data):
+        with open(self.changelog_filename, "w", encoding="utf-8") as f:
+            f.write(data)
+
+    def read_changelog_file(self):
+        with open(self.changelog_filename, encoding="utf-8") as f:
+            return f.read()
+
+    def test_prepend_to_existing_file(self):
+        self.write_changelog_file("# Version: 1.0.0\n")
+
+        self.update_changelog_file("# Version: 1.1.0 \U0001F389\n")
+
+        self.assertEqual(
+            self.read_changelog_file(),
+            "# Version: 1.1.0 \U0001F389\n\n\n# Version: 1.0.0\n",
+        )
+        self.assertEqual(os.listdir(self.directory), ["CHANGELOG.md"])
+
+    def test_create_missing_file(self):
+        self.update_changelog_file("# Version: 1.0.0\n")
+
+        self.assertEqual(self.read_changelog_file(), "# Version: 1.0.0\n")
+
+    def test_existing_empty_file(self):
+        self.write_changelog_file("")
+
+        self.update_changelog_file("# Version: 1.0.0\n")
+
+        self.assertEqual(self.read_changelog_file(), "# Version: 1.0.0\n")
+
+    def test_file_mode_is_preserved(self):
+        self.write_changelog_file("# Version: 1.0.0\n")
+        os.chmod(self.changelog_filename, 0o640)
+
+        self.update_changelog_file("# Version: 1.1.0\n")
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.changelog_filename).st_mode), 0o640)
+
+    @unittest.skipUnless(os.geteuid() == 0, "changing the owner requires root")
+    def test_file_owner_is_preserved(self):
+        self.write_changelog_file("# Version: 1.0.0\n")
+        os.chown(self.changelog_filename, 1001, 1001)
+
+        self.update_changelog_file("# Version: 1.1.0\n")
+
+        file_stat = os.stat(self.changelog_filename)
+        self.assertEqual((file_stat.st_uid, file_stat.st_gid), (1001, 1001))
+
+    def test_symlink_target_is_updated(self):
+        docs_directory = os.path.join(self.directory, "docs")
+        os.mkdir(docs_directory)
+        target_filename = os.path.join(docs_directory, "CHANGELOG.md")
+        os.symlink(target_filename, self.changelog_filename)
+        self.write_changelog_file("# Version: 1.0.0\n")
+
+        self.update_changelog_file("# Version: 1.1.0\n")
+
+        self.assertTrue(os.path.islink(self.changelog_filename))
+        self.assertEqual(
+            self.read_changelog_file(), "# Version: 1.1.0\n\n\n# Version: 1.0.0\n"
+        )
+        self.assertEqual(os.listdir(docs_directory), ["CHANGELOG.md"])
+
+    def test_temp_file_is_removed_when_replace_fails(self):
+        self.write_changelog_file("# Version: 1.0.0\n")
+
+        with mock.patch("scripts.main.os.replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.update_changelog_file("# Version: 1.1.0\n")
+
+        self.assertEqual(self.read_changelog_file(), "# Version: 1.0.0\n")
+        self.assertEqual(os.listdir(self.directory), ["CHANGELOG.md"])